@@ -34,6 +34,7 @@ import hashlib
 import shutil
 import base64
 import json
+import stat
 import ssl
 import os
 import re
@@ -47,7 +48,7 @@ __all__ = [
     "BaseError", "JsonRequestError", "AuthError", "VersionManifestError", "VersionError", "JvmLoadingError",
         "BinaryNotFound",
     "LibrarySpecifier",
-    "http_request", "json_request", "json_simple_request",
+    "http_request", "json_request", "json_simple_request", "get_http_ssl_context",
     "merge_dict",
     "interpret_rule_os", "interpret_rule", "interpret_args",
     "replace_vars", "replace_list_vars",
@@ -55,6 +56,7 @@ __all__ = [
     "get_jvm_bin_filename",
     "can_extract_native",
     "from_iso_date",
+    "get_file_size",
     # "calc_input_sha1",  TODO: To add in the future when stabilized
     "LEGACY_JVM_ARGUMENTS"
 ]
@@ -301,7 +303,8 @@ class Version:
         client_download = self.version_meta.get("downloads", {}).get("client")
         if client_download is not None:
             entry = DownloadEntry.from_meta(client_download, self.version_jar_file, name=f"{self.id}.jar")
-            if not path.isfile(entry.dst) or path.getsize(entry.dst) != entry.size:
+            jar_size = get_file_size(entry.dst)
+            if jar_size is None or (entry.size is not None and jar_size != entry.size):
                 self.dl.append(entry)
         elif not path.isfile(self.version_jar_file):
             raise VersionError(VersionError.JAR_NOT_FOUND, self.id)
@@ -349,29 +352,35 @@ class Version:
 
         assets = {}
 
+        # Bound to locals because this loop runs for thousands of assets.
+        path_join = path.join
+        dl_append = self.dl.append
+
         for asset_id, asset_obj in assets_index["objects"].items():
             asset_hash = asset_obj["hash"]
             asset_hash_prefix = asset_hash[:2]
             asset_size = asset_obj["size"]
-            asset_file = path.join(assets_objects_dir, asset_hash_prefix, asset_hash)
+            asset_file = path_join(assets_objects_dir, asset_hash_prefix, asset_hash)
             assets[asset_id] = asset_file
-            if not path.isfile(asset_file) or path.getsize(asset_file) != asset_size:
+            if get_file_size(asset_file) != asset_size:
                 asset_url = f"{RESOURCES_URL}{asset_hash_prefix}/{asset_hash}"
-                self.dl.append(DownloadEntry(asset_url, asset_file, size=asset_size, sha1=asset_hash, name=asset_id))
+                dl_append(DownloadEntry(asset_url, asset_file, size=asset_size, sha1=asset_hash, name=asset_id))
 
         def finalize():
             if assets_mapped_to_resources or assets_virtual:
+                created_dirs = set()
+                def copy_asset(src_file: str, dst_file: str):
+                    if not path.isfile(dst_file):
+                        dst_dir = path.dirname(dst_file)
+                        if dst_dir not in created_dirs:
+                            os.makedirs(dst_dir, exist_ok=True)
+                            created_dirs.add(dst_dir)
+                        shutil.copyfile(src_file, dst_file)
                 for asset_id_to_copy, asset_file_to_copy in assets.items():
                     if assets_mapped_to_resources:
-                        resources_asset_file = path.join(self.context.work_dir, "resources", asset_id_to_copy)
-                        if not path.isfile(resources_asset_file):
-                            os.makedirs(path.dirname(resources_asset_file), exist_ok=True)
-                            shutil.copyfile(asset_file_to_copy, resources_asset_file)
+                        copy_asset(asset_file_to_copy, path.join(self.context.work_dir, "resources", asset_id_to_copy))
                     if assets_virtual:
-                        virtual_asset_file = path.join(assets_virtual_dir, asset_id_to_copy)
-                        if not path.isfile(virtual_asset_file):
-                            os.makedirs(path.dirname(virtual_asset_file), exist_ok=True)
-                            shutil.copyfile(asset_file_to_copy, virtual_asset_file)
+                        copy_asset(asset_file_to_copy, path.join(assets_virtual_dir, asset_id_to_copy))
 
         self.dl.add_callback(finalize)
         self.assets_index_version = assets_index_version
@@ -392,7 +401,8 @@ class Version:
             logging_file_info = client_logging["file"]
             logging_file = path.join(self.context.assets_dir, "log_configs", logging_file_info["id"])
             download_entry = DownloadEntry.from_meta(logging_file_info, logging_file, name=logging_file_info["id"])
-            if not path.isfile(logging_file) or path.getsize(logging_file) != download_entry.size:
+            logging_size = get_file_size(logging_file)
+            if logging_size is None or (download_entry.size is not None and logging_size != download_entry.size):
                 self.dl.append(download_entry)
             self.logging_file = logging_file
             self.logging_argument = client_logging["argument"]
@@ -487,20 +497,20 @@ class Version:
             if lib_dl_entry is None:
                 lib_path_raw = lib_spec.jar_file_path()
                 lib_path = path.join(self.context.libraries_dir, lib_path_raw)
-                if not path.isfile(lib_path):
-                    # The official launcher seems to default to their repository, it will also allows us
-                    # to prevent launch if such lib cannot be found.
-                    lib_repo_url: str = lib_obj.get("url", LIBRARIES_URL)
-                    if lib_repo_url[-1] != "/":
-                        lib_repo_url += "/"  # Let's be sure to have a '/' as last character.
-                    lib_dl_entry = DownloadEntry(f"{lib_repo_url}{lib_path_raw}", lib_path, name=str(lib_spec))
+                # The official launcher seems to default to their repository, it will also allows us
+                # to prevent launch if such lib cannot be found. This entry has no size, so it is
+                # only downloaded below if the file doesn't exist.
+                lib_repo_url: str = lib_obj.get("url", LIBRARIES_URL)
+                if lib_repo_url[-1] != "/":
+                    lib_repo_url += "/"  # Let's be sure to have a '/' as last character.
+                lib_dl_entry = DownloadEntry(f"{lib_repo_url}{lib_path_raw}", lib_path, name=str(lib_spec))
 
             # Even if no download entry has been found, we add the path because it might be already downloaded.
             lib_libs.append(lib_path)
 
-            if lib_dl_entry is not None:
-                if not path.isfile(lib_path) or (lib_dl_entry.size is not None and path.getsize(lib_path) != lib_dl_entry.size):
-                    self.dl.append(lib_dl_entry)
+            lib_size = get_file_size(lib_path)
+            if lib_size is None or (lib_dl_entry.size is not None and lib_size != lib_dl_entry.size):
+                self.dl.append(lib_dl_entry)
                 
         self.classpath_libs.append(self.version_jar_file)
 
@@ -557,7 +567,7 @@ class Version:
             if jvm_file["type"] == "file":
                 jvm_file_path = path.join(jvm_dir, jvm_file_path_prefix)
                 jvm_download_info = jvm_file["downloads"]["raw"]
-                if not path.isfile(jvm_file_path) or path.getsize(jvm_file_path) != jvm_download_info["size"]:
+                if get_file_size(jvm_file_path) != jvm_download_info["size"]:
                     self.dl.append(DownloadEntry.from_meta(jvm_download_info, jvm_file_path, name=jvm_file_path_prefix))
                 if jvm_file.get("executable", False):
                     jvm_exec_files.append(jvm_file_path)
@@ -817,9 +827,18 @@ class Start:
                             native_name = native_name[native_name.rindex("/") + 1:]
                         except ValueError:
                             native_name = native_name
+                        native_file_path = path.join(bin_dir, native_name)
+                        native_size = native_zip_info.file_size
+                        if native_size == 0:
+                            # Nothing to decompress, just create the empty file.
+                            open(native_file_path, "wb").close()
+                            continue
+                        # Buffer sized to the file (between 8 KiB and 1 MiB) to avoid many small reads and writes,
+                        # the lower bound also avoids buffering=1, which means line buffering.
+                        native_buffer_len = max(min(native_size, 1 << 20), 8192)
                         with native_zip.open(native_zip_info, "r") as native_zip_file:
-                            with open(path.join(bin_dir, native_name), "wb") as native_file:
-                                shutil.copyfileobj(native_zip_file, native_file)
+                            with open(native_file_path, "wb", buffering=native_buffer_len) as native_file:
+                                shutil.copyfileobj(native_zip_file, native_file, native_buffer_len)
 
         for bin_file_raw in self.bin_files:
             # Resolve a potential symlink and check if the binary exists before linking.
@@ -1390,15 +1409,29 @@ class DownloadReport:
 
 class DownloadList:
 
-    __slots__ = "entries", "callbacks", "count", "size"
+    __slots__ = "entries", "unique_entries", "callbacks", "count", "size"
 
     def __init__(self):
         self.entries: Dict[str, List[DownloadEntry]] = {}
+        self.unique_entries: Dict[DownloadEntry, DownloadEntry] = {}
         self.callbacks: List[Callable[[], None]] = []
         self.count = 0
         self.size = 0
 
     def append(self, entry: DownloadEntry):
+        """
+        Add an entry to download, if an equal entry (same URL, destination, size and SHA1) has
+        already been added, this one is not added again. This happens when multiple assets share
+        the same object, or when inherited versions list the same libraries. In such case, the
+        name of the first entry is kept and the fallbacks of the duplicate are merged into it.
+        """
+        existing_entry = self.unique_entries.get(entry)
+        if existing_entry is not None:
+            if existing_entry is not entry and entry.fallbacks is not None:
+                for fallback in entry.fallbacks:
+                    if existing_entry.fallbacks is None or fallback not in existing_entry.fallbacks:
+                        existing_entry.add_fallback(fallback)
+            return
         url_parsed = url_parse.urlparse(entry.url)
         if url_parsed.scheme not in ("http", "https"):
             raise ValueError(f"Illegal URL scheme '{url_parsed.scheme}://' for HTTP connection.")
@@ -1407,6 +1440,7 @@ class DownloadList:
         if entries is None:
             self.entries[host_key] = entries = []
         entries.append(entry)
+        self.unique_entries[entry] = entry
         self.count += 1
         if entry.size is not None:
             self.size += entry.size
@@ -1414,6 +1448,7 @@ class DownloadList:
     def reset(self):
         """ Clear the whole download list (entries, callbacks, total count and size). """
         self.entries.clear()
+        self.unique_entries.clear()
         self.callbacks.clear()
         self.count = 0
         self.size = 0
@@ -1448,6 +1483,9 @@ class DownloadList:
             # Maximum tries count or a single entry.
             max_try_count = 3
 
+            # Parent directories already created, many entries share the same directory.
+            created_dirs = set()
+
             # Internal utility to allow iterating over redirections.
             def download_internal(current_dl: DownloadList, next_dl: DownloadList):
 
@@ -1474,7 +1512,10 @@ class DownloadList:
                             size_target = 0 if entry.size is None else entry.size
                             error = None
 
-                            for _i in range(max_try_count):
+                            try_count = 0
+                            while try_count < max_try_count:
+
+                                try_count += 1
 
                                 try:
                                     conn.request("GET", entry.url, None, headers)
@@ -1491,12 +1532,18 @@ class DownloadList:
                                     while res.readinto(buffer):
                                         pass  # This loop is used to skip all bytes in the stream, and allow further request.
                                     error = DownloadReport.NOT_FOUND
+                                    if res.status == 404:
+                                        # Not found is not transient, skip remaining tries and go to fallbacks.
+                                        try_count = max_try_count
                                     continue
 
                                 sha1 = None if entry.sha1 is None else hashlib.sha1()
                                 size = 0
 
-                                os.makedirs(path.dirname(entry.dst), exist_ok=True)
+                                dst_dir = path.dirname(entry.dst)
+                                if dst_dir not in created_dirs:
+                                    os.makedirs(dst_dir, exist_ok=True)
+                                    created_dirs.add(dst_dir)
                                 try:
                                     with open(entry.dst, "wb") as dst_fp:
                                         while True:
@@ -1527,7 +1574,7 @@ class DownloadList:
                                 else:
                                     # When successful, add the downloaded size to the final size in report.
                                     report.final_size += size
-                                    break  # Break the for loop in order to skip the for-else branch
+                                    break  # Break the while loop in order to skip the while-else branch
 
                                 # We are here only when the file download has started but checks have failed,
                                 # then we should remove the file.
@@ -1538,7 +1585,7 @@ class DownloadList:
                                 total_size -= size
 
                             else:
-                                # This for-else branch is only triggered when break is not triggered.
+                                # This while-else branch is only triggered when break is not triggered.
                                 if entry.fallbacks is not None and len(entry.fallbacks):
                                     # If there are fallbacks, don't set the error and go to them.
                                     for fallback_entry in entry.fallbacks:
@@ -1719,14 +1766,8 @@ def http_request(url: str, method: str, *,
 
     try:
 
-        try:
-            import certifi
-            ctx = ssl.create_default_context(cafile=certifi.where())
-        except ImportError:
-            ctx = None
-
         req = UrlRequest(url, data, headers, method=method)
-        res: HTTPResponse = url_request.urlopen(req, timeout=timeout, context=ctx)
+        res: HTTPResponse = url_request.urlopen(req, timeout=timeout, context=get_http_ssl_context())
 
     except HTTPError as err:
         res = cast(HTTPResponse, err)
@@ -1738,6 +1779,24 @@ def http_request(url: str, method: str, *,
     return res.status, res.read()
 
 
+_http_ssl_context: Optional[ssl.SSLContext] = None
+_http_ssl_context_loaded = False
+def get_http_ssl_context() -> Optional[ssl.SSLContext]:
+    """
+    Return the SSL context used by `http_request`, using certifi's CA bundle if installed or None
+    for the default context. It's only created once because loading the CA bundle is costly.
+    """
+    global _http_ssl_context, _http_ssl_context_loaded
+    if not _http_ssl_context_loaded:
+        try:
+            import certifi
+            _http_ssl_context = ssl.create_default_context(cafile=certifi.where())
+        except ImportError:
+            _http_ssl_context = None
+        _http_ssl_context_loaded = True
+    return _http_ssl_context
+
+
 def json_request(url: str, method: str, *,
                  data: Optional[bytes] = None,
                  headers: Optional[dict] = None,
@@ -1939,6 +1998,18 @@ def from_iso_date(raw: str) -> datetime:
     return dt
 
 
+def get_file_size(file_path: str) -> Optional[int]:
+    """
+    Return the size of the given file, or None if it doesn't exist or is not a regular file.
+    This is equivalent to `path.isfile` followed by `path.getsize`, but with a single stat.
+    """
+    try:
+        st = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+    return st.st_size if stat.S_ISREG(st.st_mode) else None
+
+
 def calc_input_sha1(input_stream, *, buffer_len: int = 8192) -> str:
     h = hashlib.sha1()
     b = bytearray(buffer_len)
@@ -1,14 +1,21 @@
 from argparse import ArgumentParser, Namespace
-from typing import Dict, List
+from typing import Dict, List, Optional, Callable, Any
+from json import JSONDecodeError
 from os import path
-import subprocess
 import sys
+import json
 import os
+import re
 
 from portablemc import Version, \
     DownloadList, DownloadEntry, DownloadReport, \
-    BaseError, \
-    http_request, json_simple_request, Context
+    BaseError, JsonRequestError, \
+    http_request, Context
+
+
+PROMO_CACHE_FILE_NAME = "portablemc_forge_promotions.json"
+
+_MAVEN_VERSION_RE = re.compile(rb"<version>([^<]+)</version>")
 
 
 def load():
@@ -63,7 +70,7 @@ def load():
             # promotion metadata. It's also the case if the version ends with '-recommended' or '-latest',
             # or if the version doesn't contains a "-".
             if game_version_alias or game_version.endswith(("-recommended", "-latest")) or "-" not in game_version:
-                promo_versions = request_promo_versions()
+                promo_versions = request_promo_versions(path.join(ctx.work_dir, PROMO_CACHE_FILE_NAME))
                 for suffix in ("", "-recommended", "-latest"):
                     tmp_forge_version = promo_versions.get(f"{game_version}{suffix}")
                     if tmp_forge_version is not None:
@@ -229,6 +236,8 @@ class ForgeVersionInstaller:
         if self.main_dir is None:
             raise ValueError()
 
+        import subprocess
+
         wrapper_jar_file = path.join(path.dirname(__file__), "wrapper", "target", "wrapper.jar")
         wrapper_completed = subprocess.run([
             self.jvm_exec,
@@ -246,33 +255,98 @@ class ForgeVersionInstaller:
 
 # Forge API
 
-def request_promo_versions() -> Dict[str, str]:
-    raw = json_simple_request("https://files.minecraftforge.net/net/minecraftforge/forge/promotions_slim.json")
-    return raw["promos"]
+def request_promo_versions(cache_file: Optional[str] = None) -> Dict[str, str]:
 
+    """
+    Request the forge promoted versions. If a cache file is given, the request is conditional
+    and the cached promotions are returned if they are not modified (or if the request fails).
+    """
 
-def request_maven_versions() -> List[str]:
+    url = "https://files.minecraftforge.net/net/minecraftforge/forge/promotions_slim.json"
 
-    status, raw = http_request("https://maven.minecraftforge.net/net/minecraftforge/forge/maven-metadata.xml", "GET", headers={
-        "Accept": "application/xml"
+    def parse(status: int, raw: bytes) -> Dict[str, str]:
+        try:
+            return json.loads(raw)["promos"]
+        except JSONDecodeError:
+            raise JsonRequestError(JsonRequestError.INVALID_RESPONSE_NOT_JSON, url, "GET", status, raw)
+
+    return _cached_request(url, parse, cache_file=cache_file, headers={
+        "Accept": "application/json"
     })
 
-    text = raw.decode()
 
-    versions = []
-    last_idx = 0
+def request_maven_versions(cache_file: Optional[str] = None) -> List[str]:
+
+    """
+    Request all forge versions available on the maven repository. If a cache file is given,
+    the request is conditional and the cached versions are returned if they are not modified
+    (or if the request fails).
+    """
 
-    while True:
-        start_idx = text.find("<version>", last_idx)
-        if start_idx == -1:
-            break
-        end_idx = text.find("</version>", start_idx + 9)
-        if end_idx == -1:
-            break
-        versions.append(text[(start_idx + 9):end_idx])
-        last_idx = end_idx + 10
+    def parse(_status: int, raw: bytes) -> List[str]:
+        return [match.group(1).decode() for match in _MAVEN_VERSION_RE.finditer(raw)]
 
-    return versions
+    return _cached_request("https://maven.minecraftforge.net/net/minecraftforge/forge/maven-metadata.xml", parse,
+                           cache_file=cache_file, headers={"Accept": "application/xml"})
+
+
+def _cached_request(url: str, parse: Callable[[int, bytes], Any], *,
+                    cache_file: Optional[str] = None,
+                    headers: Optional[dict] = None) -> Any:
+
+    """
+    Make a GET request and return its data parsed by the `parse` function. If a cache file is
+    given, the previously parsed data is stored in it together with the 'ETag' and 'Last-Modified'
+    headers of the response, these are sent back on next requests so that a 304 response doesn't
+    need to be downloaded nor parsed again. Like `VersionManifest`, the cached data is returned
+    for any non-200 status or `OSError`, only if no cache is available the error is surfaced.
+    """
+
+    headers = {} if headers is None else dict(headers)
+    cache_data = None
+
+    if cache_file is not None:
+        try:
+            with open(cache_file, "rt") as cache_fp:
+                cache_data = json.load(cache_fp)
+        except (OSError, JSONDecodeError):
+            pass
+        if not isinstance(cache_data, dict) or "data" not in cache_data:
+            cache_data = None  # Ignore invalid cache files, they will be overwritten.
+        else:
+            if "etag" in cache_data:
+                headers["If-None-Match"] = cache_data["etag"]
+            if "last_modified" in cache_data:
+                headers["If-Modified-Since"] = cache_data["last_modified"]
+
+    rcv_headers = {}
+
+    try:
+        status, raw = http_request(url, "GET", headers=headers, rcv_headers=rcv_headers)
+    except OSError:
+        if cache_data is None:
+            raise
+        return cache_data["data"]
+
+    if status != 200 and cache_data is not None:
+        # This can be a 304 status, or any error status where we fall back to cached data.
+        return cache_data["data"]
+
+    data = parse(status, raw)
+
+    if cache_file is not None and status == 200:
+        cache_data = {"data": data}
+        for header_name, header_value in rcv_headers.items():
+            header_name = header_name.lower()
+            if header_name == "etag":
+                cache_data["etag"] = header_value
+            elif header_name == "last-modified":
+                cache_data["last_modified"] = header_value
+        os.makedirs(path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "wt") as cache_fp:
+            json.dump(cache_data, cache_fp, indent=2)
+
+    return data
 
 
 # Errors
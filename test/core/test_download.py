@@ -1,5 +1,7 @@
 from portablemc import DownloadList, DownloadEntry, DownloadReport
+from http.server import HTTPServer, BaseHTTPRequestHandler
 from os import path
+import threading
 import pytest
 
 
@@ -129,3 +131,86 @@ def test_download(tmp_path):
     assert not path.isfile(sacrificial1.dst)
 
     dl.reset()
+
+
+def test_download_list_duplicates(tmp_path):
+
+    url = "https://resources.download.minecraft.net/bd/bdf48ef6b5d0d23bbb02e17d04865216179f510a"
+    dst = str(tmp_path / "icon_16x16.png")
+
+    dl = DownloadList()
+    dl.append(DownloadEntry(url, dst, size=3665, name="first"))
+    dl.append(DownloadEntry(url, dst, size=3665, name="duplicate"))
+    assert dl.count == 1
+    assert dl.size == 3665
+
+    # Entries with the same destination but different checks are not duplicates.
+    dl.append(DownloadEntry(url, dst, size=1189))
+    assert dl.count == 2
+    assert dl.size == 3665 + 1189
+
+    # Fallbacks of a duplicate are merged into the first entry, which keeps its name.
+    first_fallback = DownloadEntry(f"{url}?first", dst, size=3665)
+    other_fallback = DownloadEntry(f"{url}?other", dst, size=3665)
+    first = DownloadEntry(url, dst, sha1="bdf48ef6b5d0d23bbb02e17d04865216179f510a", name="first")
+    first.add_fallback(first_fallback)
+    duplicate = DownloadEntry(url, dst, sha1="bdf48ef6b5d0d23bbb02e17d04865216179f510a", name="duplicate")
+    duplicate.add_fallback(first_fallback)
+    duplicate.add_fallback(other_fallback)
+    dl.append(first)
+    dl.append(duplicate)
+    assert dl.count == 3
+    assert first.name == "first"
+    assert first.fallbacks == [first_fallback, other_fallback]
+
+    dl.reset()
+    dl.append(DownloadEntry(url, dst, size=3665))
+    assert dl.count == 1
+
+
+def test_download_not_found_fallback(tmp_path):
+
+    requested_paths = []
+
+    class Handler(BaseHTTPRequestHandler):
+
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            requested_paths.append(self.path)
+            if self.path.endswith("/not_found"):
+                body, status = b"not found", 404
+            else:
+                body, status = b"fallback", 200
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+
+        base_url = f"http://127.0.0.1:{server.server_port}"
+        dst = str(tmp_path / "file.txt")
+
+        entry = DownloadEntry(f"{base_url}/not_found", dst, name="not_found")
+        entry.add_fallback(DownloadEntry(f"{base_url}/fallback", dst, size=8, name="fallback"))
+
+        dl = DownloadList()
+        dl.append(entry)
+        report = dl.download_files()
+
+        # The 404 is not retried and is not a failure because the fallback succeeded.
+        assert len(report.fails) == 0
+        assert [p for p in requested_paths if p.endswith("/not_found")] == [f"{base_url}/not_found"]
+        with open(dst, "rb") as fp:
+            assert fp.read() == b"fallback"
+
+    finally:
+        server.shutdown()
+        server.server_close()
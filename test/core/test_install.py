@@ -54,3 +54,34 @@ def test_install(tmp_path, version):
     assert not len(repl["auth_session"])
 
     assert repl["launcher_name"] == "portablemc"
+
+
+def test_install_download_without_size(tmp_path):
+
+    version = "nosize"
+    ctx = Context(str(tmp_path))
+    ver = NoValidationVersion(ctx, version)
+    ver.version_dir = str(tmp_path / "versions" / version)
+    ver.version_meta = {
+        "downloads": {"client": {"url": "https://example.com/client.jar"}},
+        "logging": {"client": {
+            "argument": "-Dlog4j.configurationFile=${path}",
+            "file": {"id": "client.xml", "url": "https://example.com/client.xml"}
+        }}
+    }
+
+    # Missing files without known size must be downloaded.
+    ver.prepare_jar()
+    ver.prepare_logger()
+    assert ver.dl.count == 2
+
+    (tmp_path / "versions" / version).mkdir(parents=True)
+    (tmp_path / "versions" / version / f"{version}.jar").write_bytes(b"jar")
+    (tmp_path / "assets" / "log_configs").mkdir(parents=True)
+    (tmp_path / "assets" / "log_configs" / "client.xml").write_bytes(b"xml")
+
+    # Existing files without known size are kept.
+    ver.dl.reset()
+    ver.prepare_jar()
+    ver.prepare_logger()
+    assert ver.dl.count == 0
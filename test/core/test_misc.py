@@ -66,6 +66,18 @@ def test_can_extract_native():
     assert not can_extract_native("foo.other")
 
 
+def test_file_size(tmp_path):
+
+    from portablemc import get_file_size
+
+    file = tmp_path / "file.bin"
+    file.write_bytes(b"hello world!")
+
+    assert get_file_size(str(file)) == 12
+    assert get_file_size(str(tmp_path / "not_found.bin")) is None
+    assert get_file_size(str(tmp_path)) is None
+
+
 def test_library_specifier():
 
     from portablemc import LibrarySpecifier
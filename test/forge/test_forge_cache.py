@@ -0,0 +1,103 @@
+import portablemc_forge
+import pytest
+import json
+
+
+class FakeHttp:
+
+    def __init__(self):
+        self.responses = []
+        self.sent_headers = []
+
+    def __call__(self, url: str, method: str, *, headers: dict = None, rcv_headers: dict = None, **kwargs):
+        self.sent_headers.append(dict(headers or {}))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        status, data, response_headers = response
+        if rcv_headers is not None:
+            rcv_headers.update(response_headers)
+        return status, data
+
+
+@pytest.fixture
+def fake_http(monkeypatch):
+    fake = FakeHttp()
+    monkeypatch.setattr(portablemc_forge, "http_request", fake)
+    return fake
+
+
+PROMOS_RAW = b'{"homepage": "", "promos": {"1.20.1-latest": "47.1.0"}}'
+PROMOS = {"1.20.1-latest": "47.1.0"}
+
+
+def test_promo_versions_cache(tmp_path, fake_http):
+
+    cache_file = tmp_path / "cache" / "promotions.json"
+
+    fake_http.responses.append((200, PROMOS_RAW, {"ETag": '"abc"', "Last-Modified": "Mon, 01 May 2023 00:00:00 GMT"}))
+    assert portablemc_forge.request_promo_versions(str(cache_file)) == PROMOS
+    assert "If-None-Match" not in fake_http.sent_headers[-1]
+    assert json.loads(cache_file.read_text()) == {
+        "data": PROMOS,
+        "etag": '"abc"',
+        "last_modified": "Mon, 01 May 2023 00:00:00 GMT"
+    }
+
+    # Not modified, the body is empty and must not be parsed.
+    fake_http.responses.append((304, b"", {}))
+    assert portablemc_forge.request_promo_versions(str(cache_file)) == PROMOS
+    assert fake_http.sent_headers[-1]["If-None-Match"] == '"abc"'
+    assert fake_http.sent_headers[-1]["If-Modified-Since"] == "Mon, 01 May 2023 00:00:00 GMT"
+
+    # Error status, falls back to cache instead of parsing the error page.
+    fake_http.responses.append((503, b"<html>Service Unavailable</html>", {}))
+    assert portablemc_forge.request_promo_versions(str(cache_file)) == PROMOS
+
+    # Connection error, falls back to cache.
+    fake_http.responses.append(OSError())
+    assert portablemc_forge.request_promo_versions(str(cache_file)) == PROMOS
+
+
+def test_promo_versions_no_cache(tmp_path, fake_http):
+
+    cache_file = tmp_path / "promotions.json"
+
+    fake_http.responses.append(OSError())
+    with pytest.raises(OSError):
+        portablemc_forge.request_promo_versions(str(cache_file))
+
+    fake_http.responses.append((503, b"<html>Service Unavailable</html>", {}))
+    with pytest.raises(portablemc_forge.JsonRequestError):
+        portablemc_forge.request_promo_versions(str(cache_file))
+
+    assert not cache_file.exists()
+
+
+@pytest.mark.parametrize("cache_content", ["not json", "[1, 2]", '{"etag": "\\"abc\\""}'])
+def test_promo_versions_invalid_cache(tmp_path, fake_http, cache_content):
+
+    cache_file = tmp_path / "promotions.json"
+    cache_file.write_text(cache_content)
+
+    fake_http.responses.append((200, PROMOS_RAW, {}))
+    assert portablemc_forge.request_promo_versions(str(cache_file)) == PROMOS
+    assert "If-None-Match" not in fake_http.sent_headers[-1]
+    assert json.loads(cache_file.read_text()) == {"data": PROMOS}
+
+
+def test_maven_versions_cache(tmp_path, fake_http):
+
+    cache_file = tmp_path / "maven.json"
+    raw = b"<metadata><versioning><versions>" \
+          b"<version>1.20.1-47.1.0</version><version>1.20.1-47.0.0</version>" \
+          b"</versions></versioning></metadata>"
+    versions = ["1.20.1-47.1.0", "1.20.1-47.0.0"]
+
+    fake_http.responses.append((200, raw, {"etag": '"xyz"'}))
+    assert portablemc_forge.request_maven_versions(str(cache_file)) == versions
+    assert fake_http.sent_headers[-1]["Accept"] == "application/xml"
+
+    fake_http.responses.append((503, b"<html>Service Unavailable</html>", {}))
+    assert portablemc_forge.request_maven_versions(str(cache_file)) == versions
+    assert fake_http.sent_headers[-1]["If-None-Match"] == '"xyz"'